@@ -6,60 +6,149 @@ Creates executables for different platforms with proper configuration
 
 import os
 import sys
+import hashlib
+import logging
+import importlib.metadata
 import subprocess
 import shutil
+import stat
 import platform
+import site
+import sysconfig
+import threading
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+log = logging.getLogger('build')
+
+SPEC_FILE = Path('file-hash-generator.spec')
+SHM_DIR = '/dev/shm'
+SHM_MIN_FREE = 512 * 1024 * 1024  # Docker's default /dev/shm is only 64 MB
+ICON_CACHE_DIR = Path('.icon-cache')
+BUILD_VENV_DIR = Path('.build-venv')
+WHEELS_CACHE_DIR = Path('.wheels-cache')
+FICLONE = 0x40049409  # Linux reflink ioctl
+
+README_TMPL = """File Hash Generator & Verifier v2.0
+====================================
+
+Platform: {platform_system} {platform_machine}
+Built on: {platform_platform}
+
+FEATURES:
+- Generate hashes for files and directories
+- Support for multiple algorithms: MD5, SHA1, SHA-3, SHA256, SHA512, xxHash64, Blake2b, Blake3, CRC32, CRC32C
+- Verify file integrity against saved hashes
+- Modern GUI with progress tracking
+- Multi-threaded processing
+- Auto-save functionality
+- Detailed error reporting
+
+USAGE:
+{usage}
+
+No Python installation required - this is a standalone executable.
+
+SYSTEM REQUIREMENTS:
+{sysreq}
+"""
 
 
 class Builder:
-    def __init__(self):
-        self.platform = platform.system().lower()
+    def __init__(self, wheel_cache=None, onefile=True, verbose=False, use_venv=False):
+        self.wheel_cache = wheel_cache
+        self.verbose = verbose
+        self.use_venv = use_venv
+        self.onefile = onefile
+        self.release_readme = None
+        # platform lookups can spawn subprocesses, so query them once
+        self.platform_system = platform.system()
+        self.platform_machine = platform.machine()
+        self.platform_platform = platform.platform()
+        self.platform = self.platform_system.lower()
         self.is_windows = self.platform == 'windows'
         self.is_macos = self.platform == 'darwin'
         self.is_linux = self.platform == 'linux'
         
+        # Tools come from the project build venv when enabled, else the current environment
+        if self.use_venv:
+            self.bin_dir = BUILD_VENV_DIR / ('Scripts' if self.is_windows else 'bin')
+            self.python = str(self.bin_dir / ('python.exe' if self.is_windows else 'python'))
+            self.site_packages = sysconfig.get_path(
+                'purelib', vars={'base': str(BUILD_VENV_DIR), 'platbase': str(BUILD_VENV_DIR)})
+        else:
+            self.bin_dir = None
+            self.python = sys.executable
+            self.site_packages = None
+        
     def create_icon(self):
         """Create a simple icon if none exists."""
+        size = 256
+        color = (46, 134, 171, 255)  # Blue color from our theme
+        line_width = 8
+        icon_file = 'icon.ico' if self.is_windows else 'icon.png'
+        
+        # The icon is deterministic, so reuse a previous render of the same parameters
+        key = hashlib.sha256(f"{size}|{color}|{line_width}|{icon_file}|v1".encode()).hexdigest()
+        cached_icon = ICON_CACHE_DIR / f"{key}{Path(icon_file).suffix}"
+        if cached_icon.exists():
+            shutil.copy2(cached_icon, icon_file)
+            print(f"✅ Using cached {icon_file}")
+            return
+        
         try:
-            from PIL import Image, ImageDraw
+            from PIL import Image
             
             # Create a simple icon
-            size = 256
             img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
             
             # Draw a simple hash/grid pattern
-            color = (46, 134, 171, 255)  # Blue color from our theme
-            line_width = 8
+            half_width = line_width // 2
             
-            # Draw grid
+            # Draw grid as solid stripe fills instead of rasterized lines
             for i in range(0, size, 32):
-                draw.line([(i, 0), (i, size)], fill=color, width=line_width)
-                draw.line([(0, i), (size, i)], fill=color, width=line_width)
+                img.paste(color, (max(i - half_width, 0), 0, i + half_width, size))
+                img.paste(color, (0, max(i - half_width, 0), size, i + half_width))
             
             # Draw border
-            draw.rectangle([0, 0, size-1, size-1], outline=color, width=line_width)
+            for box in [(0, 0, size, line_width), (0, size - line_width, size, size),
+                        (0, 0, line_width, size), (size - line_width, 0, size, size)]:
+                img.paste(color, box)
             
             # Save different formats
             if self.is_windows:
                 # For Windows .ico
-                sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+                sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
                 icons = []
+                # Resize each size from the previous (larger) one rather than
+                # from the full source image
+                current = img
                 for s in sizes:
-                    icons.append(img.resize(s, Image.Resampling.LANCZOS))
-                icons[0].save('icon.ico', format='ICO', sizes=[(s.width, s.height) for s in icons])
+                    if current.size != s:
+                        # Lanczos detail is invisible at small icon sizes, use
+                        # cheap area averaging there
+                        resample = Image.Resampling.LANCZOS if s[0] >= 96 else Image.Resampling.BOX
+                        current = current.resize(s, resample)
+                    icons.append(current)
+                icons[0].save('icon.ico', format='ICO', sizes=[(s.width, s.height) for s in icons],
+                              append_images=icons[1:])
                 print("✅ Created icon.ico")
                 
             elif self.is_macos:
                 # For macOS .icns (simplified - would need more work for full icns)
-                img.resize((128, 128), Image.Resampling.LANCZOS).save('icon.png')
+                img.resize((128, 128), Image.Resampling.LANCZOS).save(
+                    'icon.png', optimize=True, compress_level=9)
                 print("✅ Created icon.png (macOS)")
                 
             else:
                 # For Linux .png
-                img.resize((128, 128), Image.Resampling.LANCZOS).save('icon.png')
+                img.resize((128, 128), Image.Resampling.LANCZOS).save(
+                    'icon.png', optimize=True, compress_level=9)
                 print("✅ Created icon.png (Linux)")
+            
+            ICON_CACHE_DIR.mkdir(exist_ok=True)
+            shutil.copy2(icon_file, cached_icon)
                 
         except ImportError:
             print("⚠️  PIL not available, creating simple placeholder icon")
@@ -108,71 +197,206 @@ VSVersionInfo(
             f.write(version_info)
         print("✅ Created version_info.txt")
     
+    def _pip_install(self, *packages):
+        """Install packages from wheels, falling back to source builds if needed."""
+        pip = [self.python, '-m', 'pip']
+        options = ['--disable-pip-version-check', '--prefer-binary', '--progress-bar', 'off']
+        if not self.verbose:
+            options.append('--quiet')
+        if self.wheel_cache:
+            options.append(f'--cache-dir={self.wheel_cache}')
+        cmd = [*pip, 'install', *options]
+        
+        if self.use_venv:
+            # Install from the local wheel cache, only going to the network to fill it
+            local_install = [*cmd, '--no-index', f'--find-links={WHEELS_CACHE_DIR}', *packages]
+            try:
+                self._run_pip(local_install, show_failure=False)
+            except subprocess.CalledProcessError:
+                self._run_pip([*pip, 'wheel', *options, '-w', str(WHEELS_CACHE_DIR), *packages])
+                self._run_pip(local_install)
+            return
+        
+        try:
+            self._run_pip([*cmd, '--only-binary=:all:', *packages], show_failure=False)
+        except subprocess.CalledProcessError:
+            # Some platforms have no wheels for the hash libraries
+            self._run_pip([*cmd, *packages])
+    
+    def _run_pip(self, cmd, show_failure=True):
+        """Run pip, capturing its output unless running verbosely.
+        
+        The captured output is printed on failure unless a fallback follows.
+        """
+        if self.verbose:
+            subprocess.run(cmd, check=True)
+            return
+        
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode:
+            if show_failure:
+                print(result.stdout[-2000:], end='')
+                print(result.stderr[-2000:], end='')
+            raise subprocess.CalledProcessError(result.returncode, cmd,
+                                                output=result.stdout, stderr=result.stderr)
+    
+    def _is_satisfied(self, spec):
+        """Check whether a requirement like 'xxhash>=3.0.0' is already installed."""
+        try:
+            try:
+                from packaging.requirements import Requirement
+            except ImportError:
+                # pip always ships a vendored copy
+                from pip._vendor.packaging.requirements import Requirement
+            
+            requirement = Requirement(spec)
+            if self.site_packages:
+                dist = next(importlib.metadata.distributions(name=requirement.name,
+                                                             path=[self.site_packages]), None)
+                if dist is None:
+                    return False
+                installed = dist.version
+            else:
+                installed = importlib.metadata.version(requirement.name)
+            return requirement.specifier.contains(installed, prereleases=True)
+        except (ImportError, importlib.metadata.PackageNotFoundError):
+            return False
+    
     def install_dependencies(self):
         """Install required dependencies."""
         print("📦 Installing dependencies...")
         
-        # Core dependencies
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'], check=True)
-        subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller>=5.0'], check=True)
+        if self.use_venv and not BUILD_VENV_DIR.exists():
+            subprocess.run([sys.executable, '-m', 'venv', str(BUILD_VENV_DIR)], check=True)
+            print(f"✅ Created {BUILD_VENV_DIR}/")
         
-        # Optional hash libraries
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'xxhash>=3.0.0'], check=True)
-            print("✅ Installed xxhash")
-        except subprocess.CalledProcessError:
-            print("⚠️  Could not install xxhash (optional)")
+        # Make Pillow from the build venv importable for create_icon
+        if self.site_packages:
+            site.addsitedir(self.site_packages)
+        
+        # PyInstaller is required; hash libraries and Pillow (icon creation) are
+        # optional and go through a single pip invocation, retried per package on failure
+        requirements = {
+            'pyinstaller': (['pyinstaller>=5.0'], True),
+            'xxhash, blake3, google-crc32c, orjson, Pillow': (
+                ['xxhash>=3.0.0', 'blake3>=0.3.0', 'google-crc32c', 'orjson', 'Pillow'], False),
+        }
+        
+        # Skip pip entirely for anything that is already installed
+        installs = {}
+        for name, (packages, required) in requirements.items():
+            if name == 'pyinstaller' and shutil.which('pyinstaller', path=self.bin_dir):
+                continue
+            missing = [spec for spec in packages if not self._is_satisfied(spec)]
+            if missing:
+                installs[name] = (missing, required)
+        
+        if not installs:
+            print("✅ All dependencies already installed")
+            return
+        
+        # Upgrade pip first, the remaining installs are independent of each other
+        # (the build venv keeps the pip it was created with)
+        if not self.use_venv:
+            self._pip_install('--upgrade', 'pip')
+        
+        required_error = None
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            future_to_name = {
+                executor.submit(self._pip_install, *packages): name
+                for name, (packages, _) in installs.items()
+            }
             
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'blake3>=0.3.0'], check=True)
-            print("✅ Installed blake3")
-        except subprocess.CalledProcessError:
-            print("⚠️  Could not install blake3 (optional)")
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                required = installs[name][1]
+                try:
+                    future.result()
+                    print(f"✅ Installed {name}")
+                except subprocess.CalledProcessError as e:
+                    if required:
+                        required_error = e
+                    else:
+                        self._install_each(installs[name][0])
         
-        # PIL for icon creation
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'Pillow'], check=True)
-            print("✅ Installed Pillow for icon creation")
-        except subprocess.CalledProcessError:
-            print("⚠️  Could not install Pillow (for icon creation)")
+        if required_error:
+            raise required_error
+    
+    def _install_each(self, packages):
+        """Retry optional packages one at a time so one failure can't block the rest."""
+        for spec in packages:
+            try:
+                self._pip_install(spec)
+                print(f"✅ Installed {spec}")
+            except subprocess.CalledProcessError:
+                print(f"⚠️  Could not install {spec} (optional)")
     
     def build_executable(self):
         """Build the executable using PyInstaller."""
         print(f"🔨 Building executable for {self.platform}...")
         
-        # Basic PyInstaller command
-        cmd = [
-            'pyinstaller',
-            '--onefile',
+        # Options baked into the .spec file
+        spec_options = [
+            '--onefile' if self.onefile else '--onedir',
             '--name', 'file-hash-generator',
         ]
         
         # Platform-specific options
         if self.is_windows:
-            cmd.extend(['--windowed', '--icon=icon.ico'])
+            spec_options.extend(['--windowed', '--icon=icon.ico'])
             if Path('version_info.txt').exists():
-                cmd.extend(['--version-file=version_info.txt'])
+                spec_options.extend(['--version-file=version_info.txt'])
         elif self.is_macos:
-            cmd.extend(['--windowed'])
+            spec_options.extend(['--windowed'])
             if Path('icon.icns').exists():
-                cmd.extend(['--icon=icon.icns'])
+                spec_options.extend(['--icon=icon.icns'])
         else:  # Linux
             if Path('icon.png').exists():
-                cmd.extend(['--icon=icon.png'])
+                spec_options.extend(['--icon=icon.png'])
         
         # Add optimization flags
-        cmd.extend([
+        # --strip only touches the collected shared libraries, and PyInstaller
+        # caches the stripped copies in the workpath. The final executable must
+        # not be stripped afterwards: the onefile archive is appended to the
+        # bootloader and strip would drop it.
+        spec_options.extend([
             '--optimize=2',
             '--strip',  # Strip debug symbols
-            '--upx-dir=/usr/bin' if shutil.which('upx') else '--noupx',
         ])
         
-        # Specify main file
-        cmd.append('main.py')
+        # Leave out stdlib packages the app never imports (tkinter is still needed)
+        for module in ['unittest', 'pydoc', 'test', 'distutils', 'lib2to3', 'xmlrpc', 'pdb']:
+            spec_options.append(f'--exclude-module={module}')
+        
+        # Options only understood when building from the .spec file
+        build_options = ['--noconfirm', '--distpath', 'dist']
+        
+        # UPX saves nothing on macOS or inside an already compressed onefile
+        # archive, so only use it for onedir builds
+        upx = shutil.which('upx')
+        if upx and not self.is_macos and not self.onefile:
+            spec_options.append('--upx-exclude=vcruntime140.dll')
+            build_options.append(f'--upx-dir={os.path.dirname(upx)}')
+        else:
+            spec_options.append('--noupx')
+        
+        # Keep PyInstaller's analysis cache on a RAM disk when it has room,
+        # otherwise it stays in build/
+        workpath = self._shm_workpath()
+        if workpath and shutil.disk_usage(SHM_DIR).free >= SHM_MIN_FREE:
+            build_options.extend(['--workpath', workpath])
         
         # Run PyInstaller
         try:
-            subprocess.run(cmd, check=True)
+            if self._spec_outdated(spec_options):
+                subprocess.run([self._tool('pyi-makespec'), *spec_options, 'main.py'], check=True)
+                # Record the options so a later build can tell if the spec is stale
+                spec_text = SPEC_FILE.read_text(encoding='utf-8')
+                SPEC_FILE.write_text(f"# makespec: {' '.join(spec_options)}\n{spec_text}",
+                                     encoding='utf-8')
+                print(f"✅ Generated {SPEC_FILE}")
+            
+            self._run_pyinstaller([self._tool('pyinstaller'), *build_options, str(SPEC_FILE)])
             print("✅ Build completed successfully!")
         except subprocess.CalledProcessError as e:
             print(f"❌ Build failed: {e}")
@@ -180,95 +404,196 @@ VSVersionInfo(
             
         return True
     
+    def _shm_workpath(self):
+        """RAM-disk workpath scoped per user and checkout, or None without /dev/shm."""
+        if not Path(SHM_DIR).is_dir():
+            return None
+        checkout = hashlib.sha256(str(Path.cwd().resolve()).encode()).hexdigest()[:12]
+        return os.path.join(SHM_DIR, f'pyi-build-{os.getuid()}-{checkout}')
+    
+    def _tool(self, name):
+        """Return the command for a console script such as pyinstaller."""
+        return str(self.bin_dir / name) if self.bin_dir else name
+    
+    def _run_pyinstaller(self, cmd):
+        """Run PyInstaller, forwarding only warnings and errors from its output."""
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   bufsize=1, text=True)
+        output_tail = deque(maxlen=50)
+        drain_thread = threading.Thread(target=self._drain_build_output,
+                                        args=(process.stdout, output_tail), daemon=True)
+        drain_thread.start()
+        
+        # Prepare release files while PyInstaller is busy
+        self.release_readme = self._render_release_readme()
+        
+        returncode = process.wait()
+        drain_thread.join()
+        if returncode:
+            print(''.join(output_tail), end='')
+            raise subprocess.CalledProcessError(returncode, cmd)
+    
+    def _drain_build_output(self, stream, output_tail):
+        """Read PyInstaller output, printing warnings/errors and keeping a tail."""
+        for line in stream:
+            output_tail.append(line)
+            if 'WARNING' in line or 'ERROR' in line:
+                print(line, end='')
+        stream.close()
+    
+    def _spec_outdated(self, spec_options):
+        """Check whether the .spec file must be regenerated."""
+        if not SPEC_FILE.exists():
+            return True
+        
+        spec_mtime = os.path.getmtime(SPEC_FILE)
+        if spec_mtime <= os.path.getmtime('main.py') or spec_mtime <= os.path.getmtime(__file__):
+            return True
+        
+        with open(SPEC_FILE, encoding='utf-8') as f:
+            return f.readline().rstrip('\n') != f"# makespec: {' '.join(spec_options)}"
+    
     def post_build_tasks(self):
         """Perform post-build tasks."""
         print("🔧 Performing post-build tasks...")
         
         # Check if executable was created
         dist_dir = Path('dist')
+        if not self.onefile:
+            dist_dir = dist_dir / 'file-hash-generator'
         if self.is_windows:
             executable = dist_dir / 'file-hash-generator.exe'
         else:
             executable = dist_dir / 'file-hash-generator'
             
-        if not executable.exists():
+        try:
+            exe_stat = executable.stat()
+        except FileNotFoundError:
             print(f"❌ Executable not found at {executable}")
             return False
         
         print(f"✅ Executable created: {executable}")
-        print(f"📊 File size: {executable.stat().st_size / 1024 / 1024:.1f} MB")
+        print(f"📊 File size: {exe_stat.st_size / (1 << 20):.1f} MB")
         
         # Create release directory
         release_dir = Path('release')
         release_dir.mkdir(exist_ok=True)
         
-        # Copy executable
-        if self.is_windows:
+        # Copy executable (the whole bundle directory for onedir builds)
+        if not self.onefile:
+            shutil.copytree(dist_dir, release_dir / 'file-hash-generator', dirs_exist_ok=True)
+        elif self.is_windows:
             shutil.copy2(executable, release_dir / 'file-hash-generator.exe')
         else:
-            shutil.copy2(executable, release_dir / 'file-hash-generator')
-            # Ensure execute permission
-            os.chmod(release_dir / 'file-hash-generator', 0o755)
+            self._fast_copy(executable, release_dir / 'file-hash-generator')
+            # Ensure execute permission (copy2 already carried over the source mode)
+            if stat.S_IMODE(exe_stat.st_mode) != 0o755:
+                os.chmod(release_dir / 'file-hash-generator', 0o755)
         
-        # Create README
-        readme_content = f"""File Hash Generator & Verifier v2.0
-====================================
-
-Platform: {platform.system()} {platform.machine()}
-Built on: {platform.platform()}
-
-FEATURES:
-- Generate hashes for files and directories
-- Support for multiple algorithms: MD5, SHA1, SHA-3, SHA256, SHA512, xxHash64, Blake2b, Blake3, CRC32
-- Verify file integrity against saved hashes
-- Modern GUI with progress tracking
-- Multi-threaded processing
-- Auto-save functionality
-- Detailed error reporting
-
-USAGE:
-{'Double-click file-hash-generator.exe to run' if self.is_windows else 'Run ./file-hash-generator from terminal or file manager'}
-
-No Python installation required - this is a standalone executable.
-
-SYSTEM REQUIREMENTS:
-"""
+        # Create README (normally already rendered while PyInstaller ran)
+        readme_content = self.release_readme or self._render_release_readme()
+        
+        (release_dir / 'README.txt').write_text(readme_content, encoding='utf-8')
         
+        print(f"✅ Release files created in {release_dir}/")
+        return True
+    
+    def _render_release_readme(self):
+        """Build the README text shipped in the release directory."""
         if self.is_windows:
-            readme_content += "- Windows 10 or later (64-bit)\n"
+            usage = 'Double-click file-hash-generator.exe to run'
+            sysreq = '- Windows 10 or later (64-bit)'
         elif self.is_macos:
-            readme_content += "- macOS 10.14 or later\n"
+            usage = 'Run ./file-hash-generator from terminal or file manager'
+            sysreq = '- macOS 10.14 or later'
         else:
-            readme_content += "- Any modern Linux distribution (64-bit)\n"
-            
-        with open(release_dir / 'README.txt', 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+            usage = 'Run ./file-hash-generator from terminal or file manager'
+            sysreq = '- Any modern Linux distribution (64-bit)'
         
-        print(f"✅ Release files created in {release_dir}/")
-        return True
+        return README_TMPL.format_map({
+            'platform_system': self.platform_system,
+            'platform_machine': self.platform_machine,
+            'platform_platform': self.platform_platform,
+            'usage': usage,
+            'sysreq': sysreq,
+        })
+    
+    def _fast_copy(self, src, dst):
+        """Copy a file by hardlink or reflink when possible, else a full copy."""
+        dst = Path(dst)
+        dst.unlink(missing_ok=True)
+        
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # Different filesystem or links unsupported
+        
+        if self.is_linux:
+            import fcntl
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                pass  # Filesystem without reflink support
+        
+        shutil.copy2(src, dst)
     
     def clean_build_files(self):
         """Clean up build artifacts."""
         print("🧹 Cleaning up build files...")
         
-        dirs_to_remove = ['build', '__pycache__']
-        files_to_remove = ['*.pyc', '*.pyo', '*.spec']
+        dirs_to_remove = [d for d in ['build', '__pycache__'] if Path(d).is_dir()]
         
-        for dir_name in dirs_to_remove:
-            if Path(dir_name).exists():
-                shutil.rmtree(dir_name)
-                print(f"🗑️  Removed {dir_name}/")
+        # Collect matching files in a single recursive pass, leaving out
+        # anything inside the directories removed as a whole
+        files_to_remove = [path for path in self._iter_bytecode_files('.')
+                           if Path(path).parts[0] not in dirs_to_remove]
         
-        for pattern in files_to_remove:
-            for file_path in Path('.').glob(pattern):
-                file_path.unlink()
-                print(f"🗑️  Removed {file_path}")
+        # The RAM-disk workpath would otherwise outlive the checkout
+        workpath = self._shm_workpath()
+        if workpath and os.path.isdir(workpath):
+            dirs_to_remove.append(workpath)
+        
+        # Deletions are I/O bound, so overlap them in a thread pool
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            removed_dirs = executor.map(self._remove_tree, dirs_to_remove)
+            removed_files = executor.map(self._remove_file, files_to_remove)
+            for dir_name in removed_dirs:
+                log.debug(f"🗑️  Removed {dir_name}/")
+            for file_path in removed_files:
+                log.debug(f"🗑️  Removed {file_path}")
+        
+        print(f"🗑️  Removed {len(dirs_to_remove)} directories and {len(files_to_remove)} files")
+    
+    def _iter_bytecode_files(self, root):
+        """Yield .pyc/.pyo files below root, skipping hidden dirs and virtualenvs."""
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith('.') or os.path.exists(os.path.join(entry.path, 'pyvenv.cfg')):
+                        continue
+                    yield from self._iter_bytecode_files(entry.path)
+                elif entry.name.endswith(('.pyc', '.pyo')):
+                    yield entry.path
+    
+    def _remove_tree(self, path):
+        """Remove a directory tree, returning its path."""
+        shutil.rmtree(path, ignore_errors=True)
+        return path
+    
+    def _remove_file(self, path):
+        """Remove a single file, returning its path."""
+        os.unlink(path)
+        return path
     
     def build(self, clean=True):
         """Main build process."""
-        print(f"🚀 Starting build process for {platform.system()}...")
+        print(f"🚀 Starting build process for {self.platform_system}...")
         print(f"Python version: {sys.version}")
-        print(f"Platform: {platform.platform()}")
+        print(f"Platform: {self.platform_platform}")
         
         try:
             # Step 1: Install dependencies
@@ -311,10 +636,22 @@ def main():
                        help='Do not clean build files after build')
     parser.add_argument('--deps-only', action='store_true',
                        help='Only install dependencies, do not build')
+    parser.add_argument('--onedir', action='store_true',
+                       help='Build a directory bundle instead of a single executable')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Show full pip output and every file removed during cleanup')
+    parser.add_argument('--venv', action='store_true',
+                       help=f'Install dependencies into {BUILD_VENV_DIR}/ from a local wheel cache')
+    parser.add_argument('--wheel-cache', metavar='DIR',
+                       help='Directory for pip to cache downloaded wheels (e.g. for CI)')
     
     args = parser.parse_args()
     
-    builder = Builder()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    
+    builder = Builder(wheel_cache=args.wheel_cache, onefile=not args.onedir, verbose=args.verbose,
+                      use_venv=args.venv)
     
     if args.deps_only:
         builder.install_dependencies()
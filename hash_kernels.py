@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled hash kernels
+Fallback xxHash64 and CRC32C implementations for platforms without the
+xxhash or google-crc32c wheels. Importing this module raises ImportError
+when numba is not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+# xxHash64 primes
+PRIME64_1 = np.uint64(0x9E3779B185EBCA87)
+PRIME64_2 = np.uint64(0xC2B2AE3D27D4EB4F)
+PRIME64_3 = np.uint64(0x165667B19E3779F9)
+PRIME64_4 = np.uint64(0x85EBCA77C2B2AE63)
+PRIME64_5 = np.uint64(0x27D4EB2F165667C5)
+
+# xxHash64 consumes input in 32-byte stripes of four 64-bit lanes
+STRIPE_SIZE = 32
+
+# Reflected Castagnoli polynomial used by CRC32C
+CRC32C_POLY = 0x82F63B78
+
+
+@njit(cache=True, nogil=True)
+def _rotl64(x, r):
+    return (x << np.uint64(r)) | (x >> np.uint64(64 - r))
+
+
+@njit(cache=True, nogil=True)
+def _read64(buf, i):
+    value = np.uint64(0)
+    for j in range(7, -1, -1):
+        value = (value << np.uint64(8)) | np.uint64(buf[i + j])
+    return value
+
+
+@njit(cache=True, nogil=True)
+def _read32(buf, i):
+    value = np.uint64(0)
+    for j in range(3, -1, -1):
+        value = (value << np.uint64(8)) | np.uint64(buf[i + j])
+    return value
+
+
+@njit(cache=True, nogil=True)
+def _xxh64_round(acc, lane):
+    acc += lane * PRIME64_2
+    acc = _rotl64(acc, 31)
+    return acc * PRIME64_1
+
+
+@njit(cache=True, nogil=True)
+def _xxh64_merge(h, acc):
+    h ^= _xxh64_round(np.uint64(0), acc)
+    return h * PRIME64_1 + PRIME64_4
+
+
+@njit(cache=True, nogil=True)
+def _xxh64_consume(acc, buf):
+    """Fold whole 32-byte stripes of buf into the four lane accumulators."""
+    v1, v2, v3, v4 = acc[0], acc[1], acc[2], acc[3]
+    for i in range(0, len(buf) - STRIPE_SIZE + 1, STRIPE_SIZE):
+        v1 = _xxh64_round(v1, _read64(buf, i))
+        v2 = _xxh64_round(v2, _read64(buf, i + 8))
+        v3 = _xxh64_round(v3, _read64(buf, i + 16))
+        v4 = _xxh64_round(v4, _read64(buf, i + 24))
+    acc[0], acc[1], acc[2], acc[3] = v1, v2, v3, v4
+
+
+@njit(cache=True, nogil=True)
+def _xxh64_digest(acc, tail, total_len):
+    """Finish a hash from the accumulators and the final partial stripe."""
+    if total_len >= STRIPE_SIZE:
+        h = _rotl64(acc[0], 1) + _rotl64(acc[1], 7) + _rotl64(acc[2], 12) + _rotl64(acc[3], 18)
+        for k in range(4):
+            h = _xxh64_merge(h, acc[k])
+    else:
+        h = PRIME64_5
+    h += np.uint64(total_len)
+
+    i = 0
+    while i + 8 <= len(tail):
+        h ^= _xxh64_round(np.uint64(0), _read64(tail, i))
+        h = _rotl64(h, 27) * PRIME64_1 + PRIME64_4
+        i += 8
+    if i + 4 <= len(tail):
+        h ^= _read32(tail, i) * PRIME64_1
+        h = _rotl64(h, 23) * PRIME64_2 + PRIME64_3
+        i += 4
+    while i < len(tail):
+        h ^= np.uint64(tail[i]) * PRIME64_5
+        h = _rotl64(h, 11) * PRIME64_1
+        i += 1
+
+    h ^= h >> np.uint64(33)
+    h *= PRIME64_2
+    h ^= h >> np.uint64(29)
+    h *= PRIME64_3
+    h ^= h >> np.uint64(32)
+    return h
+
+
+@njit(cache=True, nogil=True)
+def _crc32c_update(crc, buf, table):
+    for b in buf:
+        crc = table[(crc ^ np.uint64(b)) & np.uint64(0xFF)] ^ (crc >> np.uint64(8))
+    return crc
+
+
+def _crc32c_table():
+    table = np.zeros(256, dtype=np.uint64)
+    for n in range(256):
+        crc = n
+        for _ in range(8):
+            crc = (crc >> 1) ^ CRC32C_POLY if crc & 1 else crc >> 1
+        table[n] = crc
+    return table
+
+
+CRC32C_TABLE = _crc32c_table()
+
+
+class XXH64:
+    """Streaming xxHash64 (seed 0) with the same interface as xxhash.xxh64."""
+
+    def __init__(self, data=b''):
+        mask = (1 << 64) - 1
+        p1, p2 = int(PRIME64_1), int(PRIME64_2)
+        self.acc = np.array([(p1 + p2) & mask, p2, 0, -p1 & mask], dtype=np.uint64)
+        self.pending = b''
+        self.total_len = 0
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        view = memoryview(data)
+        self.total_len += len(view)
+
+        # Complete a stripe left over from the previous update first
+        if self.pending:
+            take = STRIPE_SIZE - len(self.pending)
+            self.pending += bytes(view[:take])
+            view = view[take:]
+            if len(self.pending) < STRIPE_SIZE:
+                return
+            _xxh64_consume(self.acc, np.frombuffer(self.pending, dtype=np.uint8))
+
+        whole = len(view) - len(view) % STRIPE_SIZE
+        if whole:
+            _xxh64_consume(self.acc, np.frombuffer(view[:whole], dtype=np.uint8))
+        self.pending = bytes(view[whole:])
+
+    def intdigest(self) -> int:
+        tail = np.frombuffer(self.pending, dtype=np.uint8)
+        return int(_xxh64_digest(self.acc, tail, np.uint64(self.total_len)))
+
+    def hexdigest(self) -> str:
+        return f"{self.intdigest():016x}"
+
+
+class CRC32C:
+    """Streaming CRC32C with the same interface as hashlib objects."""
+
+    def __init__(self, data=b''):
+        self.crc = np.uint64(0xFFFFFFFF)
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        self.crc = _crc32c_update(self.crc, np.frombuffer(data, dtype=np.uint8), CRC32C_TABLE)
+
+    def hexdigest(self) -> str:
+        return f"{int(self.crc) ^ 0xFFFFFFFF:08x}"
@@ -8,13 +8,20 @@ Enhanced version with comprehensive algorithms and better UI.
 import os
 import sys
 import json
+import mmap
 import hashlib
+import importlib
 import threading
+import multiprocessing
 import time
+import queue
+import ssl
 import zlib
+from collections import Counter, defaultdict
+from itertools import groupby, islice
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Tuple, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Tuple, Optional, Callable, Iterable
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from datetime import datetime
@@ -32,90 +39,264 @@ try:
 except ImportError:
     BLAKE3_AVAILABLE = False
 
+try:
+    import google_crc32c
+    CRC32C_AVAILABLE = True
+except ImportError:
+    CRC32C_AVAILABLE = False
+
+# Numba-compiled fallbacks for xxHash64 and CRC32C, only loaded when a wheel is missing.
+# Imported by name so PyInstaller doesn't pull numba and numpy into the bundle; numba
+# raises RuntimeError rather than ImportError when it can't cache a frozen module
+hash_kernels = None
+if not (XXHASH_AVAILABLE and CRC32C_AVAILABLE):
+    try:
+        hash_kernels = importlib.import_module('hash_kernels')
+    except Exception:
+        pass
+HASH_KERNELS_AVAILABLE = hash_kernels is not None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Read size bounds; the actual chunk size scales with the file size
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Files in this size range are hashed through mmap, MMAP_CHUNK_SIZE at a time;
+# HashGenerator takes the lower bound as mmap_threshold
+MMAP_MIN_SIZE = 1024 * 1024
+MMAP_MAX_SIZE = 256 * 1024 * 1024
+MMAP_CHUNK_SIZE = 1024 * 1024
+
+# Files this large, however they are read (mmap, pipelined reads or Blake3's own map),
+# are evicted from the page cache after hashing so one pass over a big tree doesn't
+# push out the user's working set. Files whose first PAGE_PROBE_SIZE bytes were
+# already cached before hashing are left alone (checked with RWF_NOWAIT, Linux only)
+EVICT_MIN_SIZE = MMAP_MIN_SIZE
+PAGE_PROBE_SIZE = 4096
+
+# Chunks hashed between checks of the stop event
+STOP_CHECK_INTERVAL = 16
+
+# Files above this size are read on a background thread while the previous chunk is hashed;
+# they are evicted from the page cache like the mmap band (see EVICT_MIN_SIZE)
+PIPELINE_MIN_SIZE = MMAP_MAX_SIZE
+
+# Blake3 hashes files this large through its own mmap, spread across all cores
+BLAKE3_MMAP_MIN_SIZE = 16 * 1024 * 1024
+
+# O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN on Windows
+OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+
+# Algorithms that release the GIL for the whole update and scale with threads
+THREADED_ALGORITHMS = ('xxHash64', 'Blake3')
+
+# Scans with fewer files than this stay on threads rather than paying for process start-up
+PROCESS_POOL_MIN_FILES = 100
+
+# Hashing tasks queued per worker during a scan; the walk itself is not throttled
+SCAN_QUEUE_DEPTH = 4
+
+# Files below SMALL_FILE_SIZE are handed to worker processes in batches
+SMALL_FILE_SIZE = 1024 * 1024
+SMALL_FILE_BATCH = 64
+
+# Threads used to stat files that were not seen during the scan
+STAT_WORKERS = 32
+
+# Hash results rendered per page in the results view, and the most entries listed per
+# section of the verify view; saving exports all of them
+RESULTS_PAGE_SIZE = 500
+
+# Milliseconds between progress redraws on the Tk thread (~30 Hz)
+PROGRESS_INTERVAL_MS = 33
+
+# Progress text templates, bound once; filled in only for the update that is shown
+HASH_PROGRESS_TEXT = "Processing: {} ({}/{})".format
+HASH_STATUS_TEXT = "Generating hashes... {}/{} files processed".format
+VERIFY_PROGRESS_TEXT = "Verifying: {} ({}/{})".format
+VERIFY_STATUS_TEXT = "Verifying files... {}/{} files checked".format
+
+# Verification hashes a directory's files together, at most VERIFY_BIN_SIZE per task,
+# with VERIFY_QUEUE_DEPTH tasks in flight per worker to bound memory for streamed manifests
+VERIFY_BIN_SIZE = 64
+VERIFY_QUEUE_DEPTH = 4
+
+# Verification statuses. Each is a single shared string, so a result entry costs one
+# reference whatever the status; an int code would be no smaller
+STATUS_MATCH = 'MATCH'
+STATUS_MISMATCH = 'MISMATCH'
+STATUS_FILE_NOT_FOUND = 'FILE_NOT_FOUND'
+STATUS_READ_ERROR = 'READ_ERROR'
+STATUS_VERIFICATION_ERROR = 'VERIFICATION_ERROR'
+
+# Worker processes are spawned rather than forked from the threaded Tk process
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+
+class Crc32Hasher:
+    """zlib CRC32 with the same interface as hashlib objects."""
+    
+    def __init__(self, data=b''):
+        self.crc = zlib.crc32(data)
+        
+    def update(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+        
+    def hexdigest(self) -> str:
+        return f"{self.crc & 0xffffffff:08x}"
+
+
+class Crc32cHasher:
+    """Hardware-accelerated CRC32C with the same interface as hashlib objects."""
+    
+    def __init__(self, data=b''):
+        self.crc = 0
+        if data:
+            self.update(data)
+        
+    def update(self, data):
+        # google_crc32c only accepts bytes, not memoryview slices
+        self.crc = google_crc32c.extend(self.crc, bytes(data))
+        
+    def hexdigest(self) -> str:
+        return f"{self.crc:08x}"
+
 
 class HashGenerator:
     """Core class for hash generation and verification operations."""
     
-    def __init__(self):
-        self.stop_event = threading.Event()
+    def __init__(self, stop_event=None, mmap_threshold: int = MMAP_MIN_SIZE):
+        # A multiprocessing event so the stop request reaches worker processes
+        self.stop_event = stop_event if stop_event is not None else MP_CONTEXT.Event()
+        # Smallest file hashed through mmap instead of read()
+        self.mmap_threshold = mmap_threshold
         self.SUPPORTED_ALGORITHMS = self._get_supported_algorithms()
+        self.backend_info = self._get_backend_info()
+        self._stat_cache = {}
         
     def _get_supported_algorithms(self):
         """Get all supported hash algorithms."""
+        # Constructors are stored directly so creating a hash object is a single C call
         algorithms = {
-            'MD5': lambda: hashlib.md5(),
-            'SHA1': lambda: hashlib.sha1(),
-            'SHA-3': lambda: hashlib.sha3_256(),
-            'SHA256': lambda: hashlib.sha256(),
-            'SHA512': lambda: hashlib.sha512(),
-            'xxHash64': lambda: xxhash.xxh64() if XXHASH_AVAILABLE else None,
-            'Blake2b': lambda: hashlib.blake2b(),
-            'Blake3': lambda: blake3.blake3() if BLAKE3_AVAILABLE else None,
-            'CRC32': lambda: None,  # Special case - handled separately
+            'MD5': getattr(hashlib, 'md5', None),
+            'SHA1': getattr(hashlib, 'sha1', None),
+            'SHA-3': getattr(hashlib, 'sha3_256', None),
+            'SHA256': getattr(hashlib, 'sha256', None),
+            'SHA512': getattr(hashlib, 'sha512', None),
+            'xxHash64': xxhash.xxh64 if XXHASH_AVAILABLE else
+                        hash_kernels.XXH64 if HASH_KERNELS_AVAILABLE else None,
+            'Blake2b': getattr(hashlib, 'blake2b', None),
+            'Blake3': blake3.blake3 if BLAKE3_AVAILABLE else None,
+            'CRC32': Crc32Hasher,
+            'CRC32C': Crc32cHasher if CRC32C_AVAILABLE else
+                      hash_kernels.CRC32C if HASH_KERNELS_AVAILABLE else None,
         }
         
         # Filter out unavailable algorithms
-        available = {}
-        for name, func in algorithms.items():
-            if name == 'CRC32':
-                available[name] = func
-            else:
-                try:
-                    test = func()
-                    if test is not None:
-                        available[name] = func
-                except:
-                    continue
-                    
-        return available
+        return {name: ctor for name, ctor in algorithms.items() if ctor is not None}
+    
+    def _get_backend_info(self):
+        """Describe which implementations back the SHA and Blake hashes."""
+        # OpenSSL 1.1.1+ picks SHA-NI / ARMv8 SHA instructions automatically
+        if hashlib.sha256.__name__.startswith('openssl_') and ssl.OPENSSL_VERSION_INFO >= (1, 1, 1):
+            openssl = ' '.join(ssl.OPENSSL_VERSION.split()[:2])
+            sha_backend = f"SHA via {openssl} (uses CPU SHA extensions when present)"
+        else:
+            sha_backend = "SHA via built-in implementation (not hardware accelerated)"
+        
+        if BLAKE3_AVAILABLE:
+            return f"{sha_backend}, Blake3 available (fastest)"
+        return sha_backend
     
     def calculate_file_hash(self, file_path: str, algorithm: str = 'SHA256', 
-                          chunk_size: int = 8192) -> Optional[str]:
+                          chunk_size: Optional[int] = None) -> Optional[str]:
         """Calculate hash for a single file."""
+        digests = self._hash_file(file_path, (algorithm,), chunk_size)
+        return digests[0] if digests else None
+    
+    def calculate_file_hashes(self, file_path: str, algorithms: List[str],
+                              chunk_size: Optional[int] = None) -> Optional[Dict[str, str]]:
+        """Calculate several hashes for a file in a single pass over its data."""
+        digests = self._hash_file(file_path, algorithms, chunk_size)
+        return dict(zip(algorithms, digests)) if digests else None
+    
+    def _hash_file(self, file_path: str, algorithms, chunk_size: Optional[int]) -> Optional[List[str]]:
+        """Return the hex digests of a file for each algorithm, in order."""
         try:
-            if algorithm not in self.SUPPORTED_ALGORITHMS:
-                raise ValueError(f"Unsupported algorithm: {algorithm}")
+            # Each algorithm dispatches through a single dict lookup to its constructor
+            hash_ctors = []
+            for algorithm in algorithms:
+                hash_ctor = self.SUPPORTED_ALGORITHMS.get(algorithm)
+                if hash_ctor is None:
+                    raise ValueError(f"Unsupported algorithm: {algorithm}")
+                hash_ctors.append(hash_ctor)
             
-            # Special handling for CRC32
-            if algorithm == 'CRC32':
-                crc = 0
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(chunk_size):
-                        if self.stop_event.is_set():
-                            return None
-                        crc = zlib.crc32(chunk, crc)
-                return f"{crc & 0xffffffff:08x}"
-            
-            # Handle xxHash
-            if algorithm == 'xxHash64' and XXHASH_AVAILABLE:
-                hasher = xxhash.xxh64()
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(chunk_size):
+            with open(os.open(file_path, OPEN_FLAGS), 'rb', buffering=0) as f:
+                file_size = os.fstat(f.fileno()).st_size
+                # Large files are dropped from the page cache once hashed, unless
+                # they were cached before this read
+                evict = file_size >= EVICT_MIN_SIZE and not _is_page_cached(f.fileno())
+                try:
+                    # Blake3 maps big files itself and hashes them with all cores
+                    if (BLAKE3_AVAILABLE and file_size >= BLAKE3_MMAP_MIN_SIZE
+                            and hash_ctors == [blake3.blake3] and hasattr(blake3.blake3, 'update_mmap')):
                         if self.stop_event.is_set():
                             return None
-                        hasher.update(chunk)
-                return hasher.hexdigest()
-            
-            # Handle Blake3
-            if algorithm == 'Blake3' and BLAKE3_AVAILABLE:
-                hasher = blake3.blake3()
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(chunk_size):
+                        hash_func = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                        hash_func.update_mmap(file_path)
+                        return [hash_func.hexdigest()]
+                    
+                    # Bigger reads for bigger files, but never a buffer larger than the file
+                    if chunk_size is None:
+                        chunk_size = min(max(MIN_CHUNK_SIZE, file_size // 64), MAX_CHUNK_SIZE,
+                                         file_size + 1)
+                    
+                    # Files that fit in one read skip the chunk loop and its per-chunk overhead
+                    if file_size < chunk_size:
                         if self.stop_event.is_set():
                             return None
-                        hasher.update(chunk)
-                return hasher.hexdigest()
-            
-            # Standard hashlib algorithms
-            hash_func = self.SUPPORTED_ALGORITHMS[algorithm]()
-            
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(chunk_size):
-                    if self.stop_event.is_set():
-                        return None
-                    hash_func.update(chunk)
+                        data = f.read()
+                        return [hash_ctor(data).hexdigest() for hash_ctor in hash_ctors]
+                    
+                    # Tell the kernel to read ahead aggressively
+                    if hasattr(os, 'posix_fadvise'):
+                        try:
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        except OSError:
+                            pass
+                    
+                    # Medium-sized files are hashed straight from a memory map,
+                    # skipping the copy into a read buffer
+                    if self.mmap_threshold <= file_size <= MMAP_MAX_SIZE:
+                        chunks = self._mmap_chunks(f, file_size, chunk_size)
+                    elif file_size > PIPELINE_MIN_SIZE:
+                        chunks = self._pipelined_read_chunks(f, chunk_size)
+                    else:
+                        chunks = self._read_chunks(f, chunk_size)
                     
-            return hash_func.hexdigest()
+                    # Close the chunk source before the file so a reader thread never outlives it
+                    try:
+                        # All hash objects share the hashlib streaming interface
+                        hash_funcs = [hash_ctor() for hash_ctor in hash_ctors]
+                        stop_is_set = self.stop_event.is_set
+                        for i, chunk in enumerate(chunks):
+                            # Checking every STOP_CHECK_INTERVAL chunks keeps stop latency to tens of MB
+                            if not i % STOP_CHECK_INTERVAL and stop_is_set():
+                                return None
+                            for hash_func in hash_funcs:
+                                hash_func.update(chunk)
+                    finally:
+                        chunks.close()
+                finally:
+                    if evict:
+                        _evict_from_page_cache(f.fileno())
+                    
+            return [hash_func.hexdigest() for hash_func in hash_funcs]
             
         except (IOError, OSError, PermissionError) as e:
             print(f"Error reading file {file_path}: {e}")
@@ -123,6 +304,84 @@ class HashGenerator:
         except Exception as e:
             print(f"Unexpected error processing {file_path}: {e}")
             return None
+    
+    def _read_chunks(self, f, chunk_size: int):
+        """Yield chunks of an unbuffered file, reusing a single read buffer."""
+        # hashlib.file_digest is no faster: on 3.11+ it runs this same readinto loop in Python
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while bytes_read := f.readinto(buffer):
+            yield view[:bytes_read]
+    
+    def _pipelined_read_chunks(self, f, chunk_size: int):
+        """Yield chunks of a file read ahead by a background thread into two recycled buffers."""
+        free_buffers = queue.Queue()
+        filled = queue.Queue(maxsize=2)
+        done = threading.Event()
+        for _ in range(2):
+            free_buffers.put(bytearray(chunk_size))
+        
+        def reader():
+            try:
+                while True:
+                    buffer = free_buffers.get()
+                    if done.is_set():
+                        break
+                    bytes_read = f.readinto(buffer)
+                    filled.put((buffer, bytes_read))
+                    if not bytes_read:
+                        break
+            except Exception as e:
+                filled.put((e, 0))
+        
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        try:
+            while True:
+                buffer, bytes_read = filled.get()
+                if isinstance(buffer, Exception):
+                    raise buffer
+                if not bytes_read:
+                    break
+                # The hash update releases the GIL, letting the reader fill the other buffer
+                with memoryview(buffer) as view, view[:bytes_read] as chunk:
+                    yield chunk
+                free_buffers.put(buffer)
+        finally:
+            # Wake the reader if it is waiting for a buffer, then let it finish
+            done.set()
+            free_buffers.put(None)
+            thread.join()
+    
+    def _mmap_chunks(self, f, file_size: int, chunk_size: int):
+        """Yield zero-copy chunks of a file through a read-only memory map."""
+        # Some filesystems (FUSE, special files) and Windows sharing locks refuse
+        # the map while read() still works
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield from self._read_chunks(f, chunk_size)
+            return
+        
+        # A file truncated while mapped raises SIGBUS on the next page touched.
+        # Verification hashes on in-process threads, so that ends the GUI process
+        # rather than a single worker
+        with mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mm)
+            chunk = None
+            try:
+                for offset in range(0, file_size, MMAP_CHUNK_SIZE):
+                    chunk = view[offset:offset + MMAP_CHUNK_SIZE]
+                    yield chunk
+                    chunk.release()
+            finally:
+                # The map can only be closed once every view on it is released
+                if chunk is not None:
+                    chunk.release()
+                view.release()
+
             
     def scan_location(self, location: str, algorithm: str = 'SHA256', 
                      progress_callback: Optional[Callable] = None,
@@ -130,117 +389,218 @@ class HashGenerator:
         """Scan a location and calculate hashes for all files."""
         results = {}
         error_files = []
-        file_list = []
+        self._stat_cache = {}
         
-        # Collect all files
+        # Files are hashed as the walk finds them; only enough are collected
+        # up front to choose between threads and processes
+        paths = self.iter_paths(location)
         try:
-            if os.path.isfile(location):
-                file_list = [location]
-            elif os.path.isdir(location):
-                for root, dirs, files in os.walk(location):
-                    if self.stop_event.is_set():
-                        break
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if os.path.isfile(file_path):
-                            file_list.append(file_path)
+            head = list(islice(paths, PROCESS_POOL_MIN_FILES))
         except Exception as e:
             print(f"Error scanning location {location}: {e}")
             return results, [f"Scan error: {str(e)}"]
         
-        total_files = len(file_list)
-        if total_files == 0:
+        if not head:
             return results, error_files
             
-        # Process files with threading
+        # xxHash and Blake3 spend nearly all their time in C without the GIL, so
+        # threads suffice; other algorithms are hashed in separate processes
+        use_threads = algorithm in THREADED_ALGORITHMS or len(head) < PROCESS_POOL_MIN_FILES
+        if use_threads:
+            # Large Blake3 hashes already use every core, so run them one at a time
+            if algorithm == 'Blake3' and all(self._stat_cache[p].st_size >= BLAKE3_MMAP_MIN_SIZE
+                                             for p in head):
+                max_workers = 1
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            hash_func = self.hash_files
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=MP_CONTEXT,
+                                           initializer=_init_hash_worker,
+                                           initargs=(self.stop_event, self.mmap_threshold))
+            hash_func = _hash_files_in_worker
+        
+        # The rest of the walk runs ahead in its own thread so the progress total
+        # counts every file found so far, while hashing queues only a few batches
+        walked = queue.Queue()
+        found_files = len(head)
+        
+        def walk():
+            nonlocal found_files
+            try:
+                for file_path in paths:
+                    found_files += 1
+                    walked.put(file_path)
+            except Exception as e:
+                print(f"Error scanning location {location}: {e}")
+                error_files.append(f"Scan error: {str(e)}")
+            finally:
+                walked.put(None)
+        
+        def walked_paths():
+            yield from head
+            while (file_path := walked.get()) is not None:
+                yield file_path
+        
+        walker = threading.Thread(target=walk, daemon=True)
+        walker.start()
+        batches = self._scan_batches(walked_paths(), batch_small_files=not use_threads)
+        
         completed_files = 0
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.calculate_file_hash, file_path, algorithm): file_path
-                for file_path in file_list
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_file):
+        pending = {}
+        with executor:
+            while True:
+                # Keep only a few batches queued per worker
+                while len(pending) < max_workers * SCAN_QUEUE_DEPTH and not self.stop_event.is_set():
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                    pending[executor.submit(hash_func, batch, algorithm)] = batch
+                if not pending:
+                    break
+                
+                # Process completed tasks
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
                 if self.stop_event.is_set():
+                    for future in pending:
+                        future.cancel()
                     break
                     
-                file_path = future_to_file[future]
-                try:
-                    hash_value = future.result()
-                    if hash_value:
-                        results[file_path] = hash_value
-                    else:
-                        error_files.append(file_path)
-                except Exception as e:
-                    print(f"Error processing {file_path}: {e}")
-                    error_files.append(f"{file_path} - Error: {str(e)}")
-                
-                completed_files += 1
-                if progress_callback:
-                    progress_callback(completed_files, total_files, file_path)
-        
+                for future in done:
+                    batch = pending.pop(future)
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        print(f"Error processing {', '.join(batch)}: {e}")
+                        batch_results = [(file_path, e) for file_path in batch]
+                    
+                    # Results come back in batch order; keying them by the batch's own
+                    # strings shares each path with the stat cache instead of the
+                    # copies unpickled from worker processes
+                    for file_path, (_, hash_value) in zip(batch, batch_results):
+                        if isinstance(hash_value, Exception):
+                            error_files.append(f"{file_path} - Error: {str(hash_value)}")
+                        elif hash_value:
+                            results[file_path] = hash_value
+                        else:
+                            error_files.append(file_path)
+                        
+                        # The total grows until the walk finishes
+                        completed_files += 1
+                        if progress_callback:
+                            progress_callback(completed_files, found_files, file_path)
+        
+        # The walk checks the stop event between directories, so this returns promptly
+        walker.join()
         return results, error_files
     
+    def iter_paths(self, location: str):
+        """Yield file paths under location as they are found, caching their stat results."""
+        for file_path, file_stat in self._iter_files(location):
+            self._stat_cache[file_path] = file_stat
+            yield file_path
+    
+    def _scan_batches(self, paths, batch_small_files: bool):
+        """Group paths into hashing tasks as they arrive from the walk."""
+        small_files = []
+        for file_path in paths:
+            # Small files are sent to workers in batches so the per-task
+            # overhead is paid once per batch rather than once per file
+            if batch_small_files and self._stat_cache[file_path].st_size < SMALL_FILE_SIZE:
+                small_files.append(file_path)
+                if len(small_files) == SMALL_FILE_BATCH:
+                    yield small_files
+                    small_files = []
+            else:
+                yield [file_path]
+        if small_files:
+            yield small_files
+    
+    def _iter_files(self, location: str):
+        """Yield (path, stat_result) for every regular file under location."""
+        if os.path.isfile(location):
+            yield location, os.stat(location)
+            return
+        if not os.path.isdir(location):
+            return
+        
+        pending_dirs = [location]
+        while pending_dirs:
+            if self.stop_event.is_set():
+                return
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif entry.is_file():
+                                yield entry.path, entry.stat()
+                        except OSError:
+                            continue
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+    
+    def hash_files(self, file_paths: List[str], algorithm: str) -> List[Tuple[str, Optional[str]]]:
+        """Calculate hashes for a batch of files."""
+        return [(file_path, self.calculate_file_hash(file_path, algorithm))
+                for file_path in file_paths]
+    
     def save_hashes(self, hash_data: Dict[str, str], error_files: List[str], 
-                   output_file: str, algorithm: str, scan_location: str) -> bool:
+                   output_file: str, algorithm: str, scan_location: str,
+                   include_file_info: bool = True) -> bool:
         """Save hash data and errors to files."""
         try:
             # Prepare main data
-            data = {
-                'metadata': {
-                    'algorithm': algorithm,
-                    'scan_location': scan_location,
-                    'timestamp': datetime.now().isoformat(),
-                    'total_files': len(hash_data),
-                    'error_files': len(error_files),
-                    'application': 'File Hash Generator v2.0'
-                },
-                'hashes': {},
-                'errors': error_files
+            metadata = {
+                'algorithm': algorithm,
+                'scan_location': scan_location,
+                'timestamp': datetime.now().isoformat(),
+                'total_files': len(hash_data),
+                'error_files': len(error_files),
+                'application': 'File Hash Generator v2.0'
             }
             
             # Convert paths and add file info
             base_path = os.path.dirname(scan_location) if os.path.isfile(scan_location) else scan_location
+            file_stats = self._stat_files(hash_data) if include_file_info else {}
             
-            for file_path, hash_value in hash_data.items():
-                try:
-                    rel_path = os.path.relpath(file_path, base_path)
-                except ValueError:
-                    rel_path = file_path
-                
-                file_size = 0
-                file_mtime = 0
-                try:
-                    stat = os.stat(file_path)
-                    file_size = stat.st_size
-                    file_mtime = stat.st_mtime
-                except:
-                    pass
-                
-                data['hashes'][rel_path] = {
-                    'hash': hash_value,
-                    'full_path': file_path,
-                    'size': file_size,
-                    'modified': file_mtime
-                }
+            def entries():
+                # Directory order lets a streamed NDJSON manifest be verified directory by directory
+                for file_path in sorted(hash_data, key=lambda path: (os.path.dirname(path), path)):
+                    hash_value = hash_data[file_path]
+                    try:
+                        rel_path = os.path.relpath(file_path, base_path)
+                    except ValueError:
+                        rel_path = file_path
+                    
+                    entry = {
+                        'hash': hash_value,
+                        'full_path': file_path
+                    }
+                    if include_file_info:
+                        file_stat = file_stats.get(file_path)
+                        entry['size'] = file_stat.st_size if file_stat else 0
+                        entry['modified'] = file_stat.st_mtime if file_stat else 0
+                    yield rel_path, entry
             
-            # Save main hash file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Save main hash file; .ndjson files get one record per line
+            if output_file.lower().endswith('.ndjson'):
+                self._stream_save_ndjson(metadata, entries(), error_files, output_file)
+            else:
+                self._stream_save_hashes(metadata, entries(), error_files, output_file)
             
             # Save separate error file if there are errors
             if error_files:
-                error_file = output_file.replace('.json', '_errors.txt')
-                with open(error_file, 'w', encoding='utf-8') as f:
-                    f.write(f"Error Report - {datetime.now().isoformat()}\n")
-                    f.write(f"Scan Location: {scan_location}\n")
-                    f.write(f"Algorithm: {algorithm}\n\n")
-                    f.write("Files with errors:\n")
-                    f.write("=" * 50 + "\n")
-                    for error in error_files:
-                        f.write(f"{error}\n")
+                header = (f"Error Report - {datetime.now().isoformat()}\n"
+                          f"Scan Location: {scan_location}\n"
+                          f"Algorithm: {algorithm}\n\n"
+                          "Files with errors:\n"
+                          + "=" * 50 + "\n")
+                lines = [f"{error}\n" for error in error_files]
+                _sidecar_path(output_file, '_errors.txt').write_text(
+                    header + ''.join(lines), encoding='utf-8')
                 
             return True
             
@@ -248,6 +608,42 @@ class HashGenerator:
             print(f"Error saving hashes: {e}")
             return False
     
+    def _stream_save_hashes(self, metadata: Dict, entries, error_files: List[str], output_file: str):
+        """Write the hash file one entry at a time instead of building the whole document."""
+        with open(output_file, 'wb') as f:
+            f.write(b'{\n  "metadata": ' + _dumps_json(metadata, 1) + b',\n  "hashes": {')
+            separator = b'\n    '
+            for rel_path, entry in entries:
+                f.write(separator + _dumps_json(rel_path) + b': ' + _dumps_json(entry, 2))
+                separator = b',\n    '
+            f.write((b'}' if separator == b'\n    ' else b'\n  }')
+                    + b',\n  "errors": ' + _dumps_json(error_files, 1) + b'\n}\n')
+    
+    def _stream_save_ndjson(self, metadata: Dict, entries, error_files: List[str], output_file: str):
+        """Write a metadata line, one line per file and a closing errors line."""
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_json_line({'metadata': metadata}))
+            for rel_path, entry in entries:
+                f.write(_dumps_json_line({'path': rel_path, **entry}))
+            f.write(_dumps_json_line({'errors': error_files}))
+    
+    def _stat_files(self, file_paths) -> Dict[str, Optional[os.stat_result]]:
+        """Stat files, reusing the scan's results and stat'ing the rest in parallel."""
+        stats = {}
+        missing = []
+        for file_path in file_paths:
+            file_stat = self._stat_cache.get(file_path)
+            if file_stat is None:
+                missing.append(file_path)
+            else:
+                stats[file_path] = file_stat
+        
+        # stat releases the GIL, which pays off on network filesystems
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(STAT_WORKERS, len(missing))) as executor:
+                stats.update(zip(missing, executor.map(_safe_stat, missing)))
+        return stats
+    
     def load_hashes(self, hash_file: str) -> Optional[Dict]:
         """Load hash data from a file."""
         try:
@@ -264,81 +660,189 @@ class HashGenerator:
             print(f"Error loading hashes: {e}")
             return None
     
+    def load_hash_entries(self, hash_file: str) -> Optional[Tuple[Dict, Iterable]]:
+        """Load a hash file's metadata and an iterator of (rel_path, file_info) entries."""
+        if not hash_file.lower().endswith('.ndjson'):
+            hash_data = self.load_hashes(hash_file)
+            if not hash_data:
+                return None
+            if not isinstance(hash_data['hashes'], dict):
+                print("Error loading hashes: Invalid hash file format")
+                return None
+            # Sorted by directory so each directory's files are read together;
+            # NDJSON entries keep their on-disk order to stay streamed
+            entries = sorted(((rel_path, file_info if _is_manifest_entry(file_info)
+                               else {'error': "invalid entry"})
+                              for rel_path, file_info in hash_data['hashes'].items()),
+                             key=lambda entry: (os.path.dirname(entry[0]), entry[0]))
+            # The exact count is known here; NDJSON relies on the header's total_files
+            metadata = dict(hash_data['metadata'], total_files=len(entries))
+            return metadata, iter(entries)
+        
+        # NDJSON entries are parsed lazily so the manifest is never held in memory
+        try:
+            f = open(hash_file, 'rb')
+            header = _loads_json(f.readline())
+            if 'metadata' not in header:
+                f.close()
+                raise ValueError("Invalid hash file format")
+        except Exception as e:
+            print(f"Error loading hashes: {e}")
+            return None
+        
+        def entries():
+            with f:
+                # Line 1 is the metadata header
+                for line_number, line in enumerate(f, 2):
+                    if not line.strip():
+                        continue
+                    # A damaged line is reported as its own entry instead of ending the run
+                    try:
+                        record = _loads_json(line)
+                    except ValueError:
+                        yield f"line {line_number}", {'error': "invalid JSON"}
+                        continue
+                    # The closing line lists the scan's errors and has no file to check
+                    if isinstance(record, dict) and record.keys() == {'errors'}:
+                        continue
+                    if not _is_manifest_entry(record) or not isinstance(record.get('path'), str):
+                        yield f"line {line_number}", {'error': "invalid entry"}
+                    else:
+                        yield record.pop('path'), record
+        
+        return header['metadata'], entries()
+    
     def verify_integrity(self, hash_file: str, base_path: str = None,
-                        progress_callback: Optional[Callable] = None) -> Tuple[Dict[str, str], List[str], List[str]]:
+                        progress_callback: Optional[Callable] = None,
+                        max_workers: int = 4) -> Tuple[Dict[str, str], List[str], List[str]]:
         """Verify file integrity against saved hashes."""
-        hash_data = self.load_hashes(hash_file)
-        if not hash_data:
+        loaded = self.load_hash_entries(hash_file)
+        if not loaded:
             return {}, [], ["Failed to load hash file"]
         
-        algorithm = hash_data['metadata']['algorithm']
-        hashes = hash_data['hashes']
+        metadata, entries = loaded
+        algorithm = metadata['algorithm']
         results = {}
         corrupted_files = []
         error_files = []
         
-        total_files = len(hashes)
+        total_files = metadata.get('total_files', 0)
         completed_files = 0
         
-        for rel_path, file_info in hashes.items():
+        bins = self._directory_bins(entries)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            while True:
+                # Keep a bounded number of bins in flight so the manifest is consumed as it is read
+                while len(pending) < max_workers * VERIFY_QUEUE_DEPTH and not self.stop_event.is_set():
+                    bin_entries = next(bins, None)
+                    if bin_entries is None:
+                        break
+                    pending.add(executor.submit(self._verify_bin, bin_entries, base_path, algorithm))
+                if not pending:
+                    break
+                
+                # Process completed tasks
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if self.stop_event.is_set():
+                    for future in pending:
+                        future.cancel()
+                    break
+                
+                for future in done:
+                    for rel_path, status, corrupted, error, current_path in future.result():
+                        if status:
+                            results[rel_path] = status
+                        if corrupted:
+                            corrupted_files.append(corrupted)
+                        if error:
+                            error_files.append(error)
+                        
+                        completed_files += 1
+                        if progress_callback:
+                            progress_callback(completed_files, max(total_files, completed_files),
+                                              current_path)
+        
+        return results, corrupted_files, error_files
+    
+    def _directory_bins(self, entries):
+        """Group consecutive manifest entries from the same directory into bounded bins."""
+        for _, group in groupby(entries, key=lambda entry: os.path.dirname(entry[0])):
+            while bin_entries := list(islice(group, VERIFY_BIN_SIZE)):
+                yield bin_entries
+    
+    def _verify_bin(self, bin_entries: List[Tuple[str, Dict]], base_path: Optional[str],
+                    algorithm: str) -> List[Tuple[str, str, Optional[Dict], Optional[str], str]]:
+        """Verify one directory's entries in order, keeping reads sequential."""
+        outcomes = []
+        for rel_path, file_info in bin_entries:
             if self.stop_event.is_set():
                 break
-                
-            stored_hash = file_info['hash']
+            outcomes.append(self._verify_one(rel_path, file_info, base_path, algorithm))
+        return outcomes
+    
+    def _verify_one(self, rel_path: str, file_info: Dict, base_path: Optional[str],
+                    algorithm: str) -> Tuple[str, str, Optional[Dict], Optional[str], str]:
+        """Check one manifest entry; returns (rel_path, status, corrupted, error, path)."""
+        # Unreadable manifest entries carry only an error and have no file to check
+        if not _is_manifest_entry(file_info):
+            error = file_info.get('error') if isinstance(file_info, dict) else None
+            return rel_path, None, None, f"{rel_path}: {error or 'invalid entry'}", rel_path
+        
+        current_path = rel_path
+        try:
+            # Entries may carry a 'hashes' map to be checked against several algorithms
+            stored_hashes = file_info.get('hashes') or {algorithm: file_info['hash']}
             full_path = file_info.get('full_path', '')
             
             # Determine actual file path
-            current_path = None
-            if base_path and os.path.exists(os.path.join(base_path, rel_path)):
-                current_path = os.path.join(base_path, rel_path)
+            found_path = None
+            based_path = os.path.join(base_path, rel_path) if base_path else None
+            if based_path and os.path.exists(based_path):
+                found_path = based_path
             elif os.path.exists(full_path):
-                current_path = full_path
+                found_path = full_path
             elif os.path.exists(rel_path):
-                current_path = rel_path
+                found_path = rel_path
             
-            if not current_path:
-                results[rel_path] = "FILE_NOT_FOUND"
-                error_files.append(f"{rel_path} - File not found")
-                completed_files += 1
-                if progress_callback:
-                    progress_callback(completed_files, total_files, rel_path)
-                continue
+            if not found_path:
+                return (rel_path, STATUS_FILE_NOT_FOUND, None,
+                        f"{rel_path} - File not found", rel_path)
+            current_path = found_path
             
-            # Calculate current hash
-            try:
-                current_hash = self.calculate_file_hash(current_path, algorithm)
-                
-                if current_hash is None:
-                    results[rel_path] = "READ_ERROR"
-                    error_files.append(f"{rel_path} - Unable to read file")
-                elif current_hash == stored_hash:
-                    results[rel_path] = "MATCH"
-                else:
-                    results[rel_path] = "MISMATCH"
-                    corrupted_files.append({
-                        'path': current_path,
-                        'relative_path': rel_path,
-                        'stored_hash': stored_hash,
-                        'current_hash': current_hash,
-                        'algorithm': algorithm
-                    })
-            except Exception as e:
-                results[rel_path] = "VERIFICATION_ERROR"
-                error_files.append(f"{rel_path} - Verification error: {str(e)}")
+            # Calculate every needed hash in one read of the file
+            current_hashes = self.calculate_file_hashes(current_path, list(stored_hashes))
+            if current_hashes is None:
+                return (rel_path, STATUS_READ_ERROR, None,
+                        f"{rel_path} - Unable to read file", current_path)
             
-            completed_files += 1
-            if progress_callback:
-                progress_callback(completed_files, total_files, current_path)
-        
-        return results, corrupted_files, error_files
+            mismatched = [alg for alg, stored_hash in stored_hashes.items()
+                          if current_hashes[alg] != stored_hash]
+            if not mismatched:
+                return rel_path, STATUS_MATCH, None, None, current_path
+            
+            alg = mismatched[0]
+            corrupted = {
+                'path': current_path,
+                'relative_path': rel_path,
+                'stored_hash': stored_hashes[alg],
+                'current_hash': current_hashes[alg],
+                'algorithm': alg
+            }
+            return rel_path, STATUS_MISMATCH, corrupted, None, current_path
+        except Exception as e:
+            return (rel_path, STATUS_VERIFICATION_ERROR, None,
+                    f"{rel_path} - Verification error: {str(e)}", current_path)
     
     def save_verification_report(self, results: Dict[str, str], corrupted_files: List[Dict], 
                                error_files: List[str], output_file: str, hash_file: str) -> bool:
         """Save verification report with corrupted files details."""
         try:
+            timestamp = datetime.now().isoformat()
+            counts = Counter(results.values())
             report = {
                 'metadata': {
-                    'verification_time': datetime.now().isoformat(),
+                    'verification_time': timestamp,
                     'source_hash_file': hash_file,
                     'total_files_checked': len(results),
                     'corrupted_files': len(corrupted_files),
@@ -346,34 +850,32 @@ class HashGenerator:
                     'application': 'File Hash Generator v2.0'
                 },
                 'summary': {
-                    'matches': sum(1 for r in results.values() if r == 'MATCH'),
-                    'mismatches': sum(1 for r in results.values() if r == 'MISMATCH'),
-                    'not_found': sum(1 for r in results.values() if r == 'FILE_NOT_FOUND'),
-                    'read_errors': sum(1 for r in results.values() if r == 'READ_ERROR'),
-                    'verification_errors': sum(1 for r in results.values() if r == 'VERIFICATION_ERROR')
+                    'matches': counts[STATUS_MATCH],
+                    'mismatches': counts[STATUS_MISMATCH],
+                    'not_found': counts[STATUS_FILE_NOT_FOUND],
+                    'read_errors': counts[STATUS_READ_ERROR],
+                    'verification_errors': counts[STATUS_VERIFICATION_ERROR]
                 },
                 'detailed_results': results,
                 'corrupted_files': corrupted_files,
                 'errors': error_files
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            _dump_json(report, output_file)
             
             # Save separate corrupted files list if any
             if corrupted_files:
-                corrupted_file = output_file.replace('.json', '_corrupted.txt')
-                with open(corrupted_file, 'w', encoding='utf-8') as f:
-                    f.write(f"Corrupted Files Report - {datetime.now().isoformat()}\n")
-                    f.write(f"Source: {hash_file}\n")
-                    f.write(f"Total corrupted files: {len(corrupted_files)}\n\n")
-                    
-                    for i, file_info in enumerate(corrupted_files, 1):
-                        f.write(f"{i}. {file_info['relative_path']}\n")
-                        f.write(f"   Full Path: {file_info['path']}\n")
-                        f.write(f"   Algorithm: {file_info['algorithm']}\n")
-                        f.write(f"   Expected:  {file_info['stored_hash']}\n")
-                        f.write(f"   Actual:    {file_info['current_hash']}\n\n")
+                header = (f"Corrupted Files Report - {timestamp}\n"
+                          f"Source: {hash_file}\n"
+                          f"Total corrupted files: {len(corrupted_files)}\n\n")
+                lines = [f"{i}. {file_info['relative_path']}\n"
+                         f"   Full Path: {file_info['path']}\n"
+                         f"   Algorithm: {file_info['algorithm']}\n"
+                         f"   Expected:  {file_info['stored_hash']}\n"
+                         f"   Actual:    {file_info['current_hash']}\n\n"
+                         for i, file_info in enumerate(corrupted_files, 1)]
+                _sidecar_path(output_file, '_corrupted.txt').write_text(
+                    header + ''.join(lines), encoding='utf-8')
             
             return True
             
@@ -390,6 +892,106 @@ class HashGenerator:
         self.stop_event.clear()
 
 
+def _sidecar_path(output_file: str, suffix: str) -> Path:
+    """Path next to output_file with its extension replaced by suffix."""
+    path = Path(output_file)
+    return path.with_name(path.stem + suffix)
+
+
+def _dumps_json(obj, indent_level: int = 0) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    # Shift nested lines so the fragment can be embedded at indent_level
+    if indent_level:
+        data = data.replace(b'\n', b'\n' + b'  ' * indent_level)
+    return data
+
+
+def _dumps_json_line(obj) -> bytes:
+    """Serialize obj as one compact line of UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _loads_json(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _dump_json(obj, output_file: str):
+    """Write obj to output_file as indented UTF-8 JSON."""
+    with open(output_file, 'wb') as f:
+        f.write(_dumps_json(obj))
+
+
+def _is_manifest_entry(file_info) -> bool:
+    """Check that a manifest entry is a record carrying a hash to verify."""
+    return isinstance(file_info, dict) and ('hash' in file_info or 'hashes' in file_info)
+
+
+def _is_page_cached(fd: int) -> bool:
+    """Check whether the start of a file is already in the page cache."""
+    # RWF_NOWAIT makes the read fail with EAGAIN instead of going to disk
+    try:
+        return os.preadv(fd, [bytearray(PAGE_PROBE_SIZE)], 0, os.RWF_NOWAIT) > 0
+    except BlockingIOError:
+        return False
+    except (AttributeError, OSError):
+        # No way to tell on this platform or filesystem, so leave the cache alone
+        return True
+
+
+def _evict_from_page_cache(fd: int):
+    """Drop a file's pages from the page cache."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def _safe_stat(file_path: str) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it can't be accessed."""
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+def _fmt_hash_row(i: int, file_path: str, hash_value: str) -> str:
+    """Format one numbered entry of the hash results view."""
+    return (f"{i:3d}. {os.path.basename(file_path)}\n"
+            f"     Path: {file_path}\n"
+            f"     Hash: {hash_value}\n\n")
+
+
+def _fmt_corrupted_row(i: int, file_info: Dict) -> str:
+    """Format one numbered entry of the verify view's corrupted-file listing."""
+    return (f"{i:3d}. ❌ {os.path.basename(file_info['path'])}\n"
+            f"     Path: {file_info['path']}\n"
+            f"     Expected: {file_info['stored_hash']}\n"
+            f"     Actual:   {file_info['current_hash']}\n\n")
+
+
+# Per-process HashGenerator used by ProcessPoolExecutor workers
+_worker_generator = None
+
+
+def _init_hash_worker(stop_event, mmap_threshold: int):
+    """Set up a worker process to share the parent's stop event and settings."""
+    global _worker_generator
+    _worker_generator = HashGenerator(stop_event, mmap_threshold)
+
+
+def _hash_files_in_worker(file_paths: List[str], algorithm: str) -> List[Tuple[str, Optional[str]]]:
+    """Hash a batch of files inside a worker process."""
+    return _worker_generator.hash_files(file_paths, algorithm)
+
+
 class ModernHashGeneratorGUI:
     """Modern GUI for the File Hash Generator and Verifier."""
     
@@ -414,9 +1016,14 @@ class ModernHashGeneratorGUI:
         self.current_operation = None
         self.hash_results = {}
         self.error_files = []
+        # Worker threads post progress here; the Tk thread applies it
+        self._progress_q = queue.Queue()
+        # Start time of the latest hash or verify run, shown by the result views
+        self._last_run_timestamp = ""
         
         self.setup_styles()
         self.setup_gui()
+        self.root.after(PROGRESS_INTERVAL_MS, self._drain_progress)
         
     def setup_styles(self):
         """Setup modern ttk styles."""
@@ -527,7 +1134,7 @@ class ModernHashGeneratorGUI:
         self.status_bar.pack_propagate(False)
         
         self.status_label = tk.Label(self.status_bar, 
-                                    text="Ready", 
+                                    text=f"Ready - {self.hash_generator.backend_info}", 
                                     bg='#E0E0E0',
                                     fg=self.colors['text'],
                                     font=('Segoe UI', 9))
@@ -624,6 +1231,11 @@ class ModernHashGeneratorGUI:
                                   style='Success.TButton', state=tk.DISABLED)
         self.save_btn.pack(side=tk.LEFT, padx=5)
         
+        self.more_results_btn = ttk.Button(btn_container, text="📄 Load next page",
+                                          command=self.show_next_results_page,
+                                          style='Modern.TButton', state=tk.DISABLED)
+        self.more_results_btn.pack(side=tk.LEFT, padx=5)
+        
         # Progress
         progress_frame = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=20)
         progress_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -775,7 +1387,8 @@ class ModernHashGeneratorGUI:
         """Browse for hash file."""
         filename = filedialog.askopenfilename(
             title="Select Hash File",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+            filetypes=[("Hash Files", "*.json *.ndjson"), ("JSON Files", "*.json"),
+                       ("NDJSON Files", "*.ndjson"), ("All Files", "*.*")]
         )
         if filename:
             self.hash_file_var.set(filename)
@@ -788,28 +1401,62 @@ class ModernHashGeneratorGUI:
             self.base_path_var.set(foldername)
             self.update_status(f"Selected base path: {os.path.basename(foldername)}")
     
+    def _set_text(self, widget, text):
+        """Replace the contents of a read-only results widget."""
+        widget.config(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        if text:
+            widget.insert(tk.END, text)
+        widget.config(state=tk.DISABLED)
+    
     def update_status(self, message):
         """Update status bar."""
         self.status_label.config(text=message)
-        self.root.update_idletasks()
     
     def update_progress(self, current, total, current_file):
+        """Queue a hash progress update; called from worker threads."""
+        self._progress_q.put(('hash', current, total, current_file))
+    
+    def update_verify_progress(self, current, total, current_file):
+        """Queue a verification progress update; called from worker threads."""
+        self._progress_q.put(('verify', current, total, current_file))
+    
+    def _drain_progress(self):
+        """Apply queued progress on the Tk thread and reschedule."""
+        self._apply_pending_progress()
+        self.root.after(PROGRESS_INTERVAL_MS, self._drain_progress)
+    
+    def _apply_pending_progress(self):
+        """Apply only the latest queued update of each kind."""
+        # Paths stay unsplit in the queue; only the update that is drawn pays for basename()
+        latest = {}
+        try:
+            while True:
+                kind, *update = self._progress_q.get_nowait()
+                latest[kind] = update
+        except queue.Empty:
+            pass
+        if 'hash' in latest:
+            self._show_hash_progress(*latest['hash'])
+        if 'verify' in latest:
+            self._show_verify_progress(*latest['verify'])
+    
+    def _show_hash_progress(self, current, total, current_file):
         """Update progress bar and status."""
         progress = (current / total) * 100 if total > 0 else 0
         self.progress_bar['value'] = progress
         filename = os.path.basename(current_file)
-        self.progress_var.set(f"Processing: {filename} ({current}/{total})")
-        self.update_status(f"Generating hashes... {current}/{total} files processed")
-        self.root.update_idletasks()
+        self.progress_var.set(HASH_PROGRESS_TEXT(filename, current, total))
+        # Tk repaints on its next idle cycle; no forced flush per file
+        self.status_label.config(text=HASH_STATUS_TEXT(current, total))
     
-    def update_verify_progress(self, current, total, current_file):
+    def _show_verify_progress(self, current, total, current_file):
         """Update verification progress bar and status."""
         progress = (current / total) * 100 if total > 0 else 0
         self.verify_progress_bar['value'] = progress
         filename = os.path.basename(current_file)
-        self.verify_progress_var.set(f"Verifying: {filename} ({current}/{total})")
-        self.update_status(f"Verifying files... {current}/{total} files checked")
-        self.root.update_idletasks()
+        self.verify_progress_var.set(VERIFY_PROGRESS_TEXT(filename, current, total))
+        self.status_label.config(text=VERIFY_STATUS_TEXT(current, total))
     
     def generate_hashes(self):
         """Generate hashes for selected location."""
@@ -827,17 +1474,20 @@ class ModernHashGeneratorGUI:
         self.save_btn.config(state=tk.DISABLED)
         
         # Clear results
-        self.results_text.delete(1.0, tk.END)
+        self._set_text(self.results_text, "")
+        self.more_results_btn.config(state=tk.DISABLED)
         self.progress_bar['value'] = 0
         
         # Reset stop event
         self.hash_generator.reset_stop_event()
         
+        # Tk paints these on its next idle cycle; the worker itself makes no Tk calls
+        self.progress_var.set("Initializing hash generation...")
+        self.update_status("Starting hash generation...")
+        
         def hash_thread():
             try:
-                self.progress_var.set("Initializing hash generation...")
-                self.update_status("Starting hash generation...")
-                self.root.update_idletasks()
+                self._last_run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 # Generate hashes
                 self.hash_results, self.error_files = self.hash_generator.scan_location(
@@ -868,48 +1518,76 @@ class ModernHashGeneratorGUI:
     
     def display_hash_results(self):
         """Display hash generation results with better formatting."""
-        self.results_text.delete(1.0, tk.END)
-        
         if not self.hash_results and not self.error_files:
-            self.results_text.insert(tk.END, "❌ No files processed or operation was cancelled.\n")
+            self._set_text(self.results_text, "❌ No files processed or operation was cancelled.\n")
             return
         
         # Header
-        self.results_text.insert(tk.END, "=" * 80 + "\n")
-        self.results_text.insert(tk.END, f"📊 HASH GENERATION RESULTS\n")
-        self.results_text.insert(tk.END, "=" * 80 + "\n\n")
+        parts = [
+            "=" * 80 + "\n",
+            f"📊 HASH GENERATION RESULTS\n",
+            "=" * 80 + "\n\n",
+        ]
         
         # Summary
-        self.results_text.insert(tk.END, f"🔧 Algorithm: {self.algorithm_var.get()}\n")
-        self.results_text.insert(tk.END, f"📁 Location: {self.location_var.get()}\n")
-        self.results_text.insert(tk.END, f"✅ Files processed: {len(self.hash_results)}\n")
-        self.results_text.insert(tk.END, f"❌ Files with errors: {len(self.error_files)}\n")
-        self.results_text.insert(tk.END, f"🕒 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        parts.append(f"🔧 Algorithm: {self.algorithm_var.get()}\n")
+        parts.append(f"📁 Location: {self.location_var.get()}\n")
+        parts.append(f"✅ Files processed: {len(self.hash_results)}\n")
+        parts.append(f"❌ Files with errors: {len(self.error_files)}\n")
+        parts.append(f"🕒 Timestamp: {self._last_run_timestamp}\n\n")
         
         # Successful hashes
         if self.hash_results:
-            self.results_text.insert(tk.END, f"✅ SUCCESSFUL HASHES ({len(self.hash_results)} files)\n")
-            self.results_text.insert(tk.END, "-" * 50 + "\n")
-            
-            for i, (file_path, hash_value) in enumerate(self.hash_results.items(), 1):
-                filename = os.path.basename(file_path)
-                self.results_text.insert(tk.END, f"{i:3d}. {filename}\n")
-                self.results_text.insert(tk.END, f"     Path: {file_path}\n")
-                self.results_text.insert(tk.END, f"     Hash: {hash_value}\n\n")
+            parts.append(f"✅ SUCCESSFUL HASHES ({len(self.hash_results)} files)\n")
+            parts.append("-" * 50 + "\n")
+        
+        header = "".join(parts)
+        header_lines = header.count('\n')
         
         # Error files
+        parts = []
         if self.error_files:
-            self.results_text.insert(tk.END, f"❌ FILES WITH ERRORS ({len(self.error_files)} files)\n")
-            self.results_text.insert(tk.END, "-" * 50 + "\n")
+            parts.append(f"❌ FILES WITH ERRORS ({len(self.error_files)} files)\n")
+            parts.append("-" * 50 + "\n")
             
             for i, error in enumerate(self.error_files, 1):
-                self.results_text.insert(tk.END, f"{i:3d}. {error}\n")
+                parts.append(f"{i:3d}. {error}\n")
+        
+        # One insert instead of one Tk call per line
+        self._set_text(self.results_text, header + "".join(parts))
         
+        # Pages of hashes are inserted at this mark, between the header and the errors
+        self.results_text.mark_set('results_page_end', f"{header_lines + 1}.0")
+        
+        # Only the first page is rendered; the full list stays in self.hash_results
+        self._results_iter = iter(self.hash_results.items())
+        self._results_shown = 0
+        self.show_next_results_page()
         self.results_text.see(1.0)
         self.save_btn.config(state=tk.NORMAL)
     
+    def show_next_results_page(self):
+        """Append the next page of hash results to the results view."""
+        page = list(islice(self._results_iter, RESULTS_PAGE_SIZE))
+        rows = "".join(_fmt_hash_row(i, file_path, hash_value)
+                       for i, (file_path, hash_value) in enumerate(page, self._results_shown + 1))
+        self._results_shown += len(page)
+        remaining = len(self.hash_results) - self._results_shown
+        
+        self.results_text.config(state=tk.NORMAL)
+        if self.results_text.tag_ranges('results_footer'):
+            self.results_text.delete('results_footer.first', 'results_footer.last')
+        self.results_text.insert('results_page_end', rows)
+        if remaining:
+            self.results_text.insert('results_page_end',
+                                     f"... ({remaining} more, use Save to export all)\n\n",
+                                     'results_footer')
+        self.results_text.config(state=tk.DISABLED)
+        self.more_results_btn.config(state=tk.NORMAL if remaining else tk.DISABLED)
+    
     def hash_generation_complete(self):
         """Re-enable controls after hash generation."""
+        self._apply_pending_progress()
         self.generate_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
         self.progress_var.set("Hash generation complete")
@@ -929,7 +1607,8 @@ class ModernHashGeneratorGUI:
             title="Save Hash Results",
             defaultextension=".json",
             initialvalue=default_name,
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+            filetypes=[("JSON Files", "*.json"), ("NDJSON Files (streamed)", "*.ndjson"),
+                       ("All Files", "*.*")]
         )
         
         if filename:
@@ -939,7 +1618,7 @@ class ModernHashGeneratorGUI:
             ):
                 messagebox.showinfo("✅ Success", f"Hash results saved to:\n{filename}")
                 if self.error_files:
-                    error_file = filename.replace('.json', '_errors.txt')
+                    error_file = _sidecar_path(filename, '_errors.txt')
                     messagebox.showinfo("📄 Additional File", f"Error report saved to:\n{error_file}")
                 self.update_status(f"Results saved to {os.path.basename(filename)}")
             else:
@@ -960,17 +1639,18 @@ class ModernHashGeneratorGUI:
         self.save_report_btn.config(state=tk.DISABLED)
         
         # Clear results
-        self.verify_results_text.delete(1.0, tk.END)
+        self._set_text(self.verify_results_text, "")
         self.verify_progress_bar['value'] = 0
         
         # Reset stop event
         self.hash_generator.reset_stop_event()
         
+        self.verify_progress_var.set("Initializing verification...")
+        self.update_status("Starting file verification...")
+        
         def verify_thread():
             try:
-                self.verify_progress_var.set("Initializing verification...")
-                self.update_status("Starting file verification...")
-                self.root.update_idletasks()
+                self._last_run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 # Verify files
                 self.verification_results, self.corrupted_files, self.verification_errors = \
@@ -1000,76 +1680,71 @@ class ModernHashGeneratorGUI:
     
     def display_verify_results(self):
         """Display verification results with enhanced formatting."""
-        self.verify_results_text.delete(1.0, tk.END)
-        
         if not self.verification_results:
-            self.verify_results_text.insert(tk.END, "❌ No files verified or operation was cancelled.\n")
+            self._set_text(self.verify_results_text, "❌ No files verified or operation was cancelled.\n")
             return
         
-        # Count results by status
-        status_counts = {'MATCH': 0, 'MISMATCH': 0, 'FILE_NOT_FOUND': 0, 'READ_ERROR': 0, 'VERIFICATION_ERROR': 0}
-        for status in self.verification_results.values():
-            status_counts[status] = status_counts.get(status, 0) + 1
+        # Group files by status and count them in one pass
+        grouped = defaultdict(list)
+        for file_path, status in self.verification_results.items():
+            grouped[status].append(file_path)
+        status_counts = Counter({status: len(files) for status, files in grouped.items()})
         
         # Header
-        self.verify_results_text.insert(tk.END, "=" * 80 + "\n")
-        self.verify_results_text.insert(tk.END, f"🔍 FILE VERIFICATION RESULTS\n")
-        self.verify_results_text.insert(tk.END, "=" * 80 + "\n\n")
+        parts = [
+            "=" * 80 + "\n",
+            f"🔍 FILE VERIFICATION RESULTS\n",
+            "=" * 80 + "\n\n",
+        ]
         
         # Summary
-        self.verify_results_text.insert(tk.END, f"📋 Hash file: {os.path.basename(self.hash_file_var.get())}\n")
-        self.verify_results_text.insert(tk.END, f"📁 Base path: {self.base_path_var.get() or 'Not specified'}\n")
-        self.verify_results_text.insert(tk.END, f"📊 Total files checked: {len(self.verification_results)}\n")
-        self.verify_results_text.insert(tk.END, f"🕒 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        parts.append(f"📋 Hash file: {os.path.basename(self.hash_file_var.get())}\n")
+        parts.append(f"📁 Base path: {self.base_path_var.get() or 'Not specified'}\n")
+        parts.append(f"📊 Total files checked: {len(self.verification_results)}\n")
+        parts.append(f"🕒 Timestamp: {self._last_run_timestamp}\n\n")
         
         # Status summary
-        self.verify_results_text.insert(tk.END, "📈 SUMMARY\n")
-        self.verify_results_text.insert(tk.END, "-" * 30 + "\n")
-        self.verify_results_text.insert(tk.END, f"✅ Matches:           {status_counts['MATCH']:4d}\n")
-        self.verify_results_text.insert(tk.END, f"❌ Mismatches:        {status_counts['MISMATCH']:4d}\n")
-        self.verify_results_text.insert(tk.END, f"❓ Not found:         {status_counts['FILE_NOT_FOUND']:4d}\n")
-        self.verify_results_text.insert(tk.END, f"⚠️  Read errors:       {status_counts['READ_ERROR']:4d}\n")
-        self.verify_results_text.insert(tk.END, f"🚫 Verification errors: {status_counts['VERIFICATION_ERROR']:4d}\n\n")
+        parts.append("📈 SUMMARY\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(f"✅ Matches:           {status_counts[STATUS_MATCH]:4d}\n")
+        parts.append(f"❌ Mismatches:        {status_counts[STATUS_MISMATCH]:4d}\n")
+        parts.append(f"❓ Not found:         {status_counts[STATUS_FILE_NOT_FOUND]:4d}\n")
+        parts.append(f"⚠️  Read errors:       {status_counts[STATUS_READ_ERROR]:4d}\n")
+        parts.append(f"🚫 Verification errors: {status_counts[STATUS_VERIFICATION_ERROR]:4d}\n\n")
         
         # Corrupted files (detailed)
         if self.corrupted_files:
-            self.verify_results_text.insert(tk.END, f"🔥 CORRUPTED FILES ({len(self.corrupted_files)} files)\n")
-            self.verify_results_text.insert(tk.END, "=" * 50 + "\n")
+            parts.append(f"🔥 CORRUPTED FILES ({len(self.corrupted_files)} files)\n")
+            parts.append("=" * 50 + "\n")
             
-            for i, file_info in enumerate(self.corrupted_files, 1):
-                filename = os.path.basename(file_info['path'])
-                self.verify_results_text.insert(tk.END, f"{i:3d}. ❌ {filename}\n")
-                self.verify_results_text.insert(tk.END, f"     Path: {file_info['path']}\n")
-                self.verify_results_text.insert(tk.END, f"     Expected: {file_info['stored_hash']}\n")
-                self.verify_results_text.insert(tk.END, f"     Actual:   {file_info['current_hash']}\n\n")
+            parts.extend(_fmt_corrupted_row(i, file_info) for i, file_info
+                         in enumerate(islice(self.corrupted_files, RESULTS_PAGE_SIZE), 1))
+            if len(self.corrupted_files) > RESULTS_PAGE_SIZE:
+                parts.append(self._more_results_note(len(self.corrupted_files)) + "\n")
         
         # All results (grouped by status)
-        self.verify_results_text.insert(tk.END, f"📋 DETAILED RESULTS\n")
-        self.verify_results_text.insert(tk.END, "-" * 30 + "\n")
-        
-        # Group files by status
-        grouped = {}
-        for file_path, status in self.verification_results.items():
-            if status not in grouped:
-                grouped[status] = []
-            grouped[status].append(file_path)
+        parts.append(f"📋 DETAILED RESULTS\n")
+        parts.append("-" * 30 + "\n")
         
         status_symbols = {
-            'MATCH': '✅',
-            'MISMATCH': '❌',
-            'FILE_NOT_FOUND': '❓',
-            'READ_ERROR': '⚠️',
-            'VERIFICATION_ERROR': '🚫'
+            STATUS_MATCH: '✅',
+            STATUS_MISMATCH: '❌',
+            STATUS_FILE_NOT_FOUND: '❓',
+            STATUS_READ_ERROR: '⚠️',
+            STATUS_VERIFICATION_ERROR: '🚫'
         }
         
         for status, files in grouped.items():
             if files:
                 symbol = status_symbols.get(status, '?')
-                self.verify_results_text.insert(tk.END, f"\n{symbol} {status} ({len(files)} files):\n")
-                for file_path in files:
+                parts.append(f"\n{symbol} {status} ({len(files)} files):\n")
+                for file_path in islice(files, RESULTS_PAGE_SIZE):
                     filename = os.path.basename(file_path)
-                    self.verify_results_text.insert(tk.END, f"  • {filename}\n")
+                    parts.append(f"  • {filename}\n")
+                parts.append(self._more_results_note(len(files)))
         
+        # One insert instead of one Tk call per line
+        self._set_text(self.verify_results_text, "".join(parts))
         self.verify_results_text.see(1.0)
         self.save_report_btn.config(state=tk.NORMAL)
         
@@ -1081,8 +1756,14 @@ class ModernHashGeneratorGUI:
                 "Check the results for details."
             )
     
+    def _more_results_note(self, count: int) -> str:
+        """Note for a verify view section cut off at RESULTS_PAGE_SIZE entries."""
+        hidden = count - RESULTS_PAGE_SIZE
+        return f"  ... ({hidden} more, save the report for the full list)\n" if hidden > 0 else ""
+    
     def verification_complete(self):
         """Re-enable controls after verification."""
+        self._apply_pending_progress()
         self.verify_btn.config(state=tk.NORMAL)
         self.verify_stop_btn.config(state=tk.DISABLED)
         self.verify_progress_var.set("Verification complete")
@@ -1112,7 +1793,7 @@ class ModernHashGeneratorGUI:
             ):
                 messagebox.showinfo("✅ Success", f"Verification report saved to:\n{filename}")
                 if self.corrupted_files:
-                    corrupted_file = filename.replace('.json', '_corrupted.txt')
+                    corrupted_file = _sidecar_path(filename, '_corrupted.txt')
                     messagebox.showinfo("📄 Additional File", f"Corrupted files list saved to:\n{corrupted_file}")
                 self.update_status(f"Report saved to {os.path.basename(filename)}")
             else:
@@ -1174,4 +1855,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Check the Numba fallback kernels against the xxhash and google-crc32c wheels."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import hash_kernels
+except Exception:
+    hash_kernels = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
+
+# Lengths around the 32-byte stripe and the 8/4/1-byte tail steps
+LENGTHS = (0, 1, 3, 4, 7, 8, 31, 32, 33, 63, 64, 100, 1000, 4096 + 5)
+
+
+def _split_points(length):
+    return sorted({0, 1, length // 3, length // 2, length - 1, length} & set(range(length + 1)))
+
+
+@unittest.skipIf(hash_kernels is None, "numba is not installed")
+class HashKernelsTest(unittest.TestCase):
+    def setUp(self):
+        self.data = os.urandom(max(LENGTHS))
+
+    def _check(self, make_kernel, reference):
+        for length in LENGTHS:
+            data = self.data[:length]
+            for split in _split_points(length):
+                with self.subTest(length=length, split=split):
+                    hasher = make_kernel()
+                    hasher.update(data[:split])
+                    hasher.update(memoryview(data)[split:])
+                    self.assertEqual(hasher.hexdigest(), reference(data))
+
+    @unittest.skipIf(xxhash is None, "xxhash is not installed")
+    def test_xxh64_matches_xxhash(self):
+        self._check(hash_kernels.XXH64, lambda data: xxhash.xxh64(data).hexdigest())
+
+    @unittest.skipIf(google_crc32c is None, "google-crc32c is not installed")
+    def test_crc32c_matches_google_crc32c(self):
+        self._check(hash_kernels.CRC32C, lambda data: f"{google_crc32c.value(data):08x}")
+
+
+if __name__ == '__main__':
+    unittest.main()
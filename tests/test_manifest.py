@@ -0,0 +1,75 @@
+"""Round-trip tests for saving and verifying hash manifests."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import HashGenerator, STATUS_MATCH, STATUS_VERIFICATION_ERROR
+
+
+class ManifestRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, 'data')
+        os.makedirs(os.path.join(self.root, 'sub'))
+        for i in range(7):
+            folder = self.root if i % 2 else os.path.join(self.root, 'sub')
+            with open(os.path.join(folder, f'file{i}.txt'), 'wb') as f:
+                f.write(os.urandom(100 + i * 1000))
+        self.generator = HashGenerator()
+
+    def _save(self, extension):
+        hash_data, error_files = self.generator.scan_location(self.root, 'SHA256')
+        self.assertEqual(len(hash_data), 7)
+        self.assertEqual(error_files, [])
+        output_file = os.path.join(self.tmp.name, f'hashes{extension}')
+        self.assertTrue(self.generator.save_hashes(hash_data, error_files, output_file,
+                                                   'SHA256', self.root))
+        return output_file
+
+    def _assert_clean_round_trip(self, extension):
+        results, corrupted, errors = self.generator.verify_integrity(self._save(extension),
+                                                                     self.root)
+        self.assertEqual(len(results), 7)
+        self.assertTrue(all(status == STATUS_MATCH for status in results.values()))
+        self.assertEqual(corrupted, [])
+        self.assertEqual(errors, [])
+
+    def test_json_round_trip(self):
+        self._assert_clean_round_trip('.json')
+
+    def test_ndjson_round_trip(self):
+        self._assert_clean_round_trip('.ndjson')
+
+    def test_malformed_json_entries_are_reported_per_entry(self):
+        output_file = self._save('.json')
+        with open(output_file, encoding='utf-8') as f:
+            data = json.load(f)
+        data['hashes'].update({'bad-int': 5, 'bad-str': 'error', 'no-hash': {}})
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        results, _, errors = self.generator.verify_integrity(output_file, self.root)
+        self.assertEqual(sum(status == STATUS_MATCH for status in results.values()), 7)
+        self.assertEqual(sorted(errors), ['bad-int: invalid entry', 'bad-str: invalid entry',
+                                          'no-hash: invalid entry'])
+
+    def test_malformed_ndjson_lines_are_reported_per_line(self):
+        output_file = self._save('.ndjson')
+        with open(output_file, 'a', encoding='utf-8') as f:
+            f.write('{"path": "b.txt"}\n{"path": 5, "hash": "x"}\n{broken\n')
+
+        results, _, errors = self.generator.verify_integrity(output_file, self.root)
+        self.assertEqual(len(results), 7)
+        self.assertNotIn(STATUS_VERIFICATION_ERROR, results.values())
+        self.assertEqual(errors, ['line 10: invalid entry', 'line 11: invalid entry',
+                                  'line 12: invalid JSON'])
+
+
+if __name__ == '__main__':
+    unittest.main()